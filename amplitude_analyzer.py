@@ -6,6 +6,7 @@ Enhanced with optional GA4 integration for comparative analysis.
 """
 
 import os
+import random
 import requests
 import time
 from datetime import datetime, timedelta
@@ -22,6 +23,32 @@ except ImportError:
 
 load_dotenv()
 
+# Static Slack blocks shared by every report
+_SLACK_DIVIDER = {"type": "divider"}
+
+_SLACK_DATA_SOURCES_HEADER = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "*📋 Data Sources*"
+    }
+}
+
+_SLACK_FOOTER = {
+    "type": "context",
+    "elements": [
+        {
+            "type": "mrkdwn",
+            "text": "🤖 *Generated by Amplitude Analytics Bot* | 📊 Data refreshed weekly | 🔗 All chart IDs validated"
+        }
+    ]
+}
+
+# Longest wait between Slack webhook retries, whatever Retry-After asks for
+_SLACK_MAX_RETRY_DELAY = 60
+
+_AMPLITUDE_SOURCES_TEXT = "*📊 Amplitude Analytics*\n*Dashboard:* <https://app.amplitude.com/analytics/thortful/dashboard/6pqbsp18|Thortful Analytics Dashboard>\n\n*Charts Used:*\n• <https://app.amplitude.com/analytics/thortful/chart/y0ivh3am|Sessions (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/5vbaz782|Sessions (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/pc9c0crz|Sessions per User (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/3d400y6n|Sessions per User (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/42c5gcv4|Session Conversion % (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/3t0wgn4i|Session Conversion % (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/4j2gp4ph|User Conversion %>"
+
 class AmplitudeAnalyzer:
     def __init__(self):
         self.api_key = os.getenv('AMPLITUDE_API_KEY')
@@ -29,6 +56,9 @@ class AmplitudeAnalyzer:
         self.slack_webhook_url = os.getenv('SLACK_WEBHOOK_URL')
         self.base_url = "https://amplitude.com/api/2/query"
         
+        # Reuse one connection pool for Amplitude chart fetches and Slack webhook posts
+        self.session = requests.Session()
+        
         # Initialize unified analyzer if available and GA4 is enabled
         self.unified_analyzer = None
         self.use_unified = False
@@ -62,7 +92,7 @@ class AmplitudeAnalyzer:
         auth = (self.api_key, self.secret_key)
         
         try:
-            response = requests.get(url, auth=auth)
+            response = self.session.get(url, auth=auth)
             print(f"Fetching chart {chart_id}: {response.status_code}")
             if response.status_code != 200:
                 print(f"Response: {response.text}")
@@ -396,7 +426,7 @@ class AmplitudeAnalyzer:
             week_info = analysis_data['week_info']
             metrics = analysis_data['metrics']
         
-        summary = f"Week {week_info['iso_week']} Analysis ({week_info['date_range']}):\n\n"
+        parts = [f"Week {week_info['iso_week']} Analysis ({week_info['date_range']}):\n\n"]
         
         # High-level YoY summary for each category
         summary_items = []
@@ -441,17 +471,17 @@ class AmplitudeAnalyzer:
         # Join all summary items
         if summary_items:
             if len(summary_items) == 1:
-                summary += f"{summary_items[0].capitalize()}. "
+                parts.append(f"{summary_items[0].capitalize()}. ")
             elif len(summary_items) == 2:
-                summary += f"{summary_items[0].capitalize()}, {summary_items[1]}. "
+                parts.append(f"{summary_items[0].capitalize()}, {summary_items[1]}. ")
             else:
-                summary += f"{summary_items[0].capitalize()}, "
+                parts.append(f"{summary_items[0].capitalize()}, ")
                 for item in summary_items[1:-1]:
-                    summary += f"{item}, "
-                summary += f"and {summary_items[-1]}. "
+                    parts.append(f"{item}, ")
+                parts.append(f"and {summary_items[-1]}. ")
         
         # Platform-specific breakdowns with driver analysis
-        summary += "\n\nPlatform Analysis:\n"
+        parts.append("\n\nPlatform Analysis:\n")
         
         # Analyze which platform is driving overall changes
         driving_insights = []
@@ -478,7 +508,7 @@ class AmplitudeAnalyzer:
         
         # Display platform details with driver context
         if driving_insights:
-            summary += f"{' • '.join(driving_insights)}\n\n"
+            parts.append(f"{' • '.join(driving_insights)}\n\n")
         
         # Web platform details
         if metrics['sessions']:
@@ -487,7 +517,7 @@ class AmplitudeAnalyzer:
                 web_sess_dir = "up" if web_sessions['yoy_change'] > 0 else "down"
                 web_current = int(web_sessions['current'])
                 web_previous = int(web_sessions['previous'])
-                summary += f"Web: sessions {web_sess_dir} {abs(web_sessions['yoy_change'])}% YoY ({web_current:,} vs {web_previous:,})"
+                parts.append(f"Web: sessions {web_sess_dir} {abs(web_sessions['yoy_change'])}% YoY ({web_current:,} vs {web_previous:,})")
                 
                 # Add conversion if available
                 if metrics['session_conversion'] and metrics['session_conversion']['web']['yoy_change'] is not None:
@@ -495,8 +525,8 @@ class AmplitudeAnalyzer:
                     web_conv_dir = "up" if web_conversion['yoy_change'] > 0 else "down"
                     web_conv_curr = web_conversion['current'] * 100
                     web_conv_prev = web_conversion['previous'] * 100
-                    summary += f", conversion {web_conv_dir} {abs(web_conversion['yoy_change'])} ppts YoY ({web_conv_curr:.1f}% vs {web_conv_prev:.1f}%)"
-                summary += "\n"
+                    parts.append(f", conversion {web_conv_dir} {abs(web_conversion['yoy_change'])} ppts YoY ({web_conv_curr:.1f}% vs {web_conv_prev:.1f}%)")
+                parts.append("\n")
         
         # App platform details  
         if metrics['sessions']:
@@ -505,7 +535,7 @@ class AmplitudeAnalyzer:
                 app_sess_dir = "up" if app_sessions['yoy_change'] > 0 else "down"
                 app_current = int(app_sessions['current'])
                 app_previous = int(app_sessions['previous'])
-                summary += f"Apps: sessions {app_sess_dir} {abs(app_sessions['yoy_change'])}% YoY ({app_current:,} vs {app_previous:,})"
+                parts.append(f"Apps: sessions {app_sess_dir} {abs(app_sessions['yoy_change'])}% YoY ({app_current:,} vs {app_previous:,})")
                 
                 # Add conversion if available
                 if metrics['session_conversion'] and metrics['session_conversion']['apps']['yoy_change'] is not None:
@@ -513,8 +543,8 @@ class AmplitudeAnalyzer:
                     app_conv_dir = "up" if app_conversion['yoy_change'] > 0 else "down"
                     app_conv_curr = app_conversion['current'] * 100
                     app_conv_prev = app_conversion['previous'] * 100
-                    summary += f", conversion {app_conv_dir} {abs(app_conversion['yoy_change'])} ppts YoY ({app_conv_curr:.1f}% vs {app_conv_prev:.1f}%)"
-                summary += "\n"
+                    parts.append(f", conversion {app_conv_dir} {abs(app_conversion['yoy_change'])} ppts YoY ({app_conv_curr:.1f}% vs {app_conv_prev:.1f}%)")
+                parts.append("\n")
         
         # Sessions per user platform breakdown with actual values
         if metrics['sessions_per_user']:
@@ -531,7 +561,7 @@ class AmplitudeAnalyzer:
                 spu_platform_details.append(f"App {app_spu_dir} {abs(app_spu['yoy_change'])}% YoY ({app_spu['current']:.2f} vs {app_spu['previous']:.2f})")
             
             if spu_platform_details:
-                summary += f"\nSessions per user: {', '.join(spu_platform_details)}"
+                parts.append(f"\nSessions per user: {', '.join(spu_platform_details)}")
         
         # User conversion analysis
         if metrics.get('user_conversion'):
@@ -540,7 +570,7 @@ class AmplitudeAnalyzer:
             # Check if we have YoY comparison data
             if isinstance(user_conv, dict) and user_conv.get('combined') and isinstance(user_conv['combined'], dict):
                 # We have YoY comparison data
-                summary += f"\nUser conversion: "
+                parts.append(f"\nUser conversion: ")
                 platform_uc_details = []
                 
                 for platform_name, platform_key in [('Web', 'web'), ('App', 'apps')]:
@@ -553,18 +583,18 @@ class AmplitudeAnalyzer:
                         platform_uc_details.append(f"{platform_name} {uc_dir} {abs(uc_change)} ppts YoY ({uc_current:.1f}% vs {uc_previous:.1f}%)")
                 
                 if platform_uc_details:
-                    summary += f"{', '.join(platform_uc_details)}"
+                    parts.append(f"{', '.join(platform_uc_details)}")
             else:
                 # We only have current values
-                summary += f"\nUser conversion platform breakdown:\n"
+                parts.append(f"\nUser conversion platform breakdown:\n")
                 if user_conv.get('combined', 0) > 0:
-                    summary += f"Combined: {user_conv['combined'] * 100:.1f}%"
+                    parts.append(f"Combined: {user_conv['combined'] * 100:.1f}%")
                 if user_conv.get('web', 0) > 0:
-                    summary += f", Web: {user_conv['web'] * 100:.1f}%"
+                    parts.append(f", Web: {user_conv['web'] * 100:.1f}%")
                 if user_conv.get('apps', 0) > 0:
-                    summary += f", App: {user_conv['apps'] * 100:.1f}%"
+                    parts.append(f", App: {user_conv['apps'] * 100:.1f}%")
         
-        return summary
+        return "".join(parts)
     
     def format_metric_for_slack(self, metric_name, value, yoy_change, is_percentage=False):
         """Format a metric with emoji and color based on performance."""
@@ -611,26 +641,32 @@ class AmplitudeAnalyzer:
         # Start with week and date
         summary_parts.append(f"Week {week_num} ({date_range}):")
         
+        # Look up each metric family once and reuse the locals below
+        sessions = metrics.get('sessions', {})
+        session_conversion = metrics.get('session_conversion', {})
+        sessions_per_user = metrics.get('sessions_per_user', {})
+        user_conversion = metrics.get('user_conversion', {})
+        
         # Key metrics summary
         key_metrics = []
         
         # Sessions
-        if metrics.get('sessions', {}).get('combined', {}).get('yoy_change') is not None:
-            sessions_data = metrics['sessions']['combined']
+        sessions_data = sessions.get('combined', {})
+        if sessions_data.get('yoy_change') is not None:
             sessions_change = sessions_data['yoy_change']
             sessions_direction = "↑" if sessions_change > 0 else "↓"
             key_metrics.append(f"Sessions {sessions_direction}{abs(sessions_change):.1f}% YoY")
         
         # Session conversion
-        if metrics.get('session_conversion', {}).get('combined', {}).get('yoy_change') is not None:
-            conv_data = metrics['session_conversion']['combined']
+        conv_data = session_conversion.get('combined', {})
+        if conv_data.get('yoy_change') is not None:
             conv_change = conv_data['yoy_change']
             conv_direction = "↑" if conv_change > 0 else "↓"
             key_metrics.append(f"Session CVR {conv_direction}{abs(conv_change):.1f}ppts YoY")
         
         # Sessions per user
-        if metrics.get('sessions_per_user', {}).get('combined', {}).get('yoy_change') is not None:
-            spu_data = metrics['sessions_per_user']['combined']
+        spu_data = sessions_per_user.get('combined', {})
+        if spu_data.get('yoy_change') is not None:
             spu_change = spu_data['yoy_change']
             spu_direction = "↑" if spu_change > 0 else "↓"
             key_metrics.append(f"Sessions/User {spu_direction}{abs(spu_change):.1f}% YoY")
@@ -645,20 +681,19 @@ class AmplitudeAnalyzer:
         
         # Web platform metrics
         web_metrics = []
-        if metrics.get('sessions', {}).get('web', {}).get('yoy_change') is not None:
-            web_sessions_change = metrics['sessions']['web']['yoy_change']
+        web_sessions_change = sessions.get('web', {}).get('yoy_change')
+        if web_sessions_change is not None:
             web_sessions_direction = "↑" if web_sessions_change > 0 else "↓"
             web_metrics.append(f"Sessions {web_sessions_direction}{abs(web_sessions_change):.1f}%")
         
-        if metrics.get('session_conversion', {}).get('web', {}).get('yoy_change') is not None:
-            web_conv_change = metrics['session_conversion']['web']['yoy_change']
+        web_conv_change = session_conversion.get('web', {}).get('yoy_change')
+        if web_conv_change is not None:
             web_conv_direction = "↑" if web_conv_change > 0 else "↓"
             web_metrics.append(f"Session CVR {web_conv_direction}{abs(web_conv_change):.1f}ppts")
         
-        if (metrics.get('user_conversion', {}).get('web', {}) and 
-            isinstance(metrics['user_conversion']['web'], dict) and 
-            metrics['user_conversion']['web'].get('yoy_change') is not None):
-            web_user_conv_change = metrics['user_conversion']['web']['yoy_change']
+        web_user_conv = user_conversion.get('web', {})
+        if isinstance(web_user_conv, dict) and web_user_conv.get('yoy_change') is not None:
+            web_user_conv_change = web_user_conv['yoy_change']
             web_user_conv_direction = "↑" if web_user_conv_change > 0 else "↓"
             web_metrics.append(f"User CVR {web_user_conv_direction}{abs(web_user_conv_change):.1f}ppts")
         
@@ -667,20 +702,19 @@ class AmplitudeAnalyzer:
         
         # App platform metrics
         app_metrics = []
-        if metrics.get('sessions', {}).get('apps', {}).get('yoy_change') is not None:
-            app_sessions_change = metrics['sessions']['apps']['yoy_change']
+        app_sessions_change = sessions.get('apps', {}).get('yoy_change')
+        if app_sessions_change is not None:
             app_sessions_direction = "↑" if app_sessions_change > 0 else "↓"
             app_metrics.append(f"Sessions {app_sessions_direction}{abs(app_sessions_change):.1f}%")
         
-        if metrics.get('session_conversion', {}).get('apps', {}).get('yoy_change') is not None:
-            app_conv_change = metrics['session_conversion']['apps']['yoy_change']
+        app_conv_change = session_conversion.get('apps', {}).get('yoy_change')
+        if app_conv_change is not None:
             app_conv_direction = "↑" if app_conv_change > 0 else "↓"
             app_metrics.append(f"Session CVR {app_conv_direction}{abs(app_conv_change):.1f}ppts")
         
-        if (metrics.get('user_conversion', {}).get('apps', {}) and 
-            isinstance(metrics['user_conversion']['apps'], dict) and 
-            metrics['user_conversion']['apps'].get('yoy_change') is not None):
-            app_user_conv_change = metrics['user_conversion']['apps']['yoy_change']
+        app_user_conv = user_conversion.get('apps', {})
+        if isinstance(app_user_conv, dict) and app_user_conv.get('yoy_change') is not None:
+            app_user_conv_change = app_user_conv['yoy_change']
             app_user_conv_direction = "↑" if app_user_conv_change > 0 else "↓"
             app_metrics.append(f"User CVR {app_user_conv_direction}{abs(app_user_conv_change):.1f}ppts")
         
@@ -698,9 +732,8 @@ class AmplitudeAnalyzer:
             result_lines.append(" | ".join(key_metrics))
         
         # Combined User CVR on third line (if available from chart data)
-        if metrics.get('user_conversion', {}).get('combined', {}).get('yoy_change') is not None:
-            uc_data = metrics['user_conversion']['combined']
-            uc_change = uc_data['yoy_change']
+        uc_change = user_conversion.get('combined', {}).get('yoy_change')
+        if uc_change is not None:
             uc_direction = "↑" if uc_change > 0 else "↓"
             result_lines.append(f"User CVR {uc_direction}{abs(uc_change):.1f}ppts YoY")
         
@@ -739,6 +772,27 @@ class AmplitudeAnalyzer:
         
         return "\n".join(result_lines) if len(result_lines) > 1 else None
 
+    def _post_to_slack(self, payload, max_attempts=5):
+        """Post a payload to the Slack webhook, backing off on 429 rate limits and 5xx errors."""
+        for attempt in range(max_attempts):
+            response = self.session.post(self.slack_webhook_url, json=payload, timeout=30)
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt == max_attempts - 1:
+                return response
+            
+            if response.status_code == 429:
+                # Honour Slack's Retry-After seconds; an HTTP-date or missing header falls back to backoff
+                try:
+                    delay = float(response.headers.get('Retry-After'))
+                except (TypeError, ValueError):
+                    delay = 2 ** attempt
+                print(f"⏳ Slack rate limited, retrying in {min(delay, _SLACK_MAX_RETRY_DELAY):.0f}s...")
+            else:
+                # Jitter keeps retries from several runs from hitting Slack in lockstep
+                delay = 2 ** attempt + random.random()
+                print(f"⏳ Slack returned {response.status_code}, retrying in {delay:.0f}s...")
+            time.sleep(max(0, min(delay, _SLACK_MAX_RETRY_DELAY)))
+    
     def send_to_slack(self, summary, analysis_data):
         """Send the executive summary to Slack via webhook with enhanced formatting."""
         if not self.slack_webhook_url:
@@ -778,7 +832,7 @@ class AmplitudeAnalyzer:
             }
             
             try:
-                response = requests.post(self.slack_webhook_url, json=error_message)
+                response = self._post_to_slack(error_message)
                 response.raise_for_status()
                 print("⚠️ Error message sent to Slack - API rate limited")
                 return True
@@ -805,9 +859,7 @@ class AmplitudeAnalyzer:
                     }
                 ]
             },
-            {
-                "type": "divider"
-            }
+            _SLACK_DIVIDER
         ]
         
         # High-level metrics section with color coding
@@ -891,9 +943,7 @@ class AmplitudeAnalyzer:
                 web_volume_pct = (web_sessions['current'] / combined_sessions['current']) * 100
                 
                 blocks.extend([
-                    {
-                        "type": "divider"
-                    },
+                    _SLACK_DIVIDER,
                     {
                         "type": "section",
                         "text": {
@@ -1021,9 +1071,7 @@ class AmplitudeAnalyzer:
             
             if comparison_fields:
                 blocks.extend([
-                    {
-                        "type": "divider"
-                    },
+                    _SLACK_DIVIDER,
                     {
                         "type": "section",
                         "text": {
@@ -1041,9 +1089,7 @@ class AmplitudeAnalyzer:
         sheets_data = self.format_for_google_sheets(analysis_data)
         if sheets_data:
             blocks.extend([
-                {
-                    "type": "divider"
-                },
+                _SLACK_DIVIDER,
                 {
                     "type": "section",
                     "text": {
@@ -1061,7 +1107,7 @@ class AmplitudeAnalyzer:
             ])
         
         # Data Sources Section
-        data_sources_text = "*📊 Amplitude Analytics*\n*Dashboard:* <https://app.amplitude.com/analytics/thortful/dashboard/6pqbsp18|Thortful Analytics Dashboard>\n\n*Charts Used:*\n• <https://app.amplitude.com/analytics/thortful/chart/y0ivh3am|Sessions (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/5vbaz782|Sessions (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/pc9c0crz|Sessions per User (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/3d400y6n|Sessions per User (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/42c5gcv4|Session Conversion % (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/3t0wgn4i|Session Conversion % (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/4j2gp4ph|User Conversion %>"
+        data_sources_text = _AMPLITUDE_SOURCES_TEXT
         
         # Add GA4 data sources if comparison is enabled
         if analysis_data.get('comparison_enabled') and 'ga4_metrics' in analysis_data:
@@ -1073,16 +1119,8 @@ class AmplitudeAnalyzer:
             data_sources_text += f"\n\n*📈 Google Analytics 4*\n*Properties:*\n• Web Property: `330311466` - <https://analytics.google.com/analytics/web/#/p330311466/reports/intelligenthome|GA4 Web Dashboard>\n• App Property: `158472024` - <https://analytics.google.com/analytics/web/#/p158472024/reports/intelligenthome|GA4 App Dashboard>\n\n*Session Data Verification ({date_range}):*\n• <https://analytics.google.com/analytics/web/#/p330311466/reports/reportinghub?params=_u..nav%3Dmaui%26_u.comparisonOption%3Ddisabled%26_u.date00%3D{start_date}%26_u.date01%3D{end_date}%26_r.explorationId%3DAnalyticsDefaultOverview|Web Sessions Report>\n• <https://analytics.google.com/analytics/web/#/p158472024/reports/reportinghub?params=_u..nav%3Dmaui%26_u.comparisonOption%3Ddisabled%26_u.date00%3D{start_date}%26_u.date01%3D{end_date}%26_r.explorationId%3DAnalyticsDefaultOverview|App Sessions Report>"
         
         blocks.extend([
-            {
-                "type": "divider"
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*📋 Data Sources*"
-                }
-            },
+            _SLACK_DIVIDER,
+            _SLACK_DATA_SOURCES_HEADER,
             {
                 "type": "section",
                 "text": {
@@ -1090,15 +1128,7 @@ class AmplitudeAnalyzer:
                     "text": data_sources_text
                 }
             },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "🤖 *Generated by Amplitude Analytics Bot* | 📊 Data refreshed weekly | 🔗 All chart IDs validated"
-                    }
-                ]
-            }
+            _SLACK_FOOTER
         ])
         
         slack_message = {
@@ -1107,7 +1137,7 @@ class AmplitudeAnalyzer:
         }
         
         try:
-            response = requests.post(self.slack_webhook_url, json=slack_message)
+            response = self._post_to_slack(slack_message)
             response.raise_for_status()
             print("✅ Report sent to Slack successfully!")
             return True
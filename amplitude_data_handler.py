@@ -8,7 +8,8 @@ import os
 import requests
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -17,6 +18,19 @@ load_dotenv()
 class AmplitudeDataHandler:
     """Handles Amplitude-specific data extraction and processing"""
     
+    __slots__ = ('api_key', 'secret_key', 'session')
+    
+    # Chart configurations from original analyzer (shared, never mutated per instance)
+    charts = MappingProxyType({
+        'sessions_current': 'y0ivh3am',
+        'sessions_previous': '5vbaz782',
+        'sessions_per_user_current': 'pc9c0crz',
+        'sessions_per_user_previous': '3d400y6n',
+        'session_conversion_current': '42c5gcv4',
+        'session_conversion_previous': '3t0wgn4i',
+        'user_conversion': '4j2gp4ph'
+    })
+    
     def __init__(self):
         self.api_key = os.getenv('AMPLITUDE_API_KEY')
         self.secret_key = os.getenv('AMPLITUDE_SECRET_KEY')
@@ -24,16 +38,8 @@ class AmplitudeDataHandler:
         if not self.api_key or not self.secret_key:
             raise ValueError("AMPLITUDE_API_KEY and AMPLITUDE_SECRET_KEY must be set in environment")
         
-        # Chart configurations from original analyzer
-        self.charts = {
-            'sessions_current': 'y0ivh3am',
-            'sessions_previous': '5vbaz782',
-            'sessions_per_user_current': 'pc9c0crz',
-            'sessions_per_user_previous': '3d400y6n',
-            'session_conversion_current': '42c5gcv4',
-            'session_conversion_previous': '3t0wgn4i',
-            'user_conversion': '4j2gp4ph'
-        }
+        # Reuse one connection pool across the chart fetches of a run
+        self.session = requests.Session()
     
     def get_chart_data(self, chart_id: str, start_date: str = None, end_date: str = None) -> str:
         """Fetch data from a specific Amplitude chart."""
@@ -41,7 +47,7 @@ class AmplitudeDataHandler:
         auth = (self.api_key, self.secret_key)
         
         try:
-            response = requests.get(url, auth=auth)
+            response = self.session.get(url, auth=auth)
             print(f"Fetching Amplitude chart {chart_id}: {response.status_code}")
             if response.status_code != 200:
                 print(f"Response: {response.text}")
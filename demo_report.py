@@ -3,8 +3,6 @@
 Demo script to show how the Amplitude report would look and send it to Slack
 """
 
-import os
-import requests
 from dotenv import load_dotenv
 from amplitude_analyzer import AmplitudeAnalyzer
 
@@ -5,29 +5,51 @@ Handles Google Analytics 4 data extraction and processing with separated logic f
 """
 
 import os
-import time
 import json
+import asyncio
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Tuple
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
-    DateRange, Dimension, Metric, RunReportRequest, FilterExpression, Filter
+    DateRange, Metric, RunReportRequest
 )
+from google.api_core import exceptions as gax
 from google.oauth2 import service_account
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# GA4 clients keyed by credential source, so every handler instance shares one gRPC channel
+_CLIENT_CACHE: Dict[str, BetaAnalyticsDataClient] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _read_max_concurrency(default: int = 5) -> int:
+    """Read GA4_MAX_CONCURRENCY, falling back to the default if invalid and clamping to at least 1"""
+    raw = os.getenv('GA4_MAX_CONCURRENCY', str(default))
+    try:
+        value = int(raw)
+    except ValueError:
+        print(f"⚠️ Invalid GA4_MAX_CONCURRENCY '{raw}', using {default}")
+        return default
+    return max(1, value)
+
 
 class GA4DataHandler:
     """Handles GA4-specific data extraction and processing"""
     
+    __slots__ = ('web_property_id', 'app_property_id', 'credentials_path', '_client')
+    
+    # Caps in-flight run_report calls across all instances to stay under GA4's concurrent request quota
+    _concurrency = threading.BoundedSemaphore(_read_max_concurrency())
+    
     def __init__(self, web_property_id: str = None, app_property_id: str = None, credentials_path: str = None):
         self.web_property_id = web_property_id or os.getenv('GA4_WEB_PROPERTY_ID')
         self.app_property_id = app_property_id or os.getenv('GA4_APP_PROPERTY_ID') 
         self.credentials_path = credentials_path or os.getenv('GA4_SERVICE_ACCOUNT_PATH')
-        self.client = None
+        self._client = None
         
         if not self.web_property_id:
             raise ValueError("GA4_WEB_PROPERTY_ID must be set in environment or passed as parameter")
@@ -35,11 +57,29 @@ class GA4DataHandler:
             raise ValueError("GA4_APP_PROPERTY_ID must be set in environment or passed as parameter")
         if not self.credentials_path and not os.getenv('GA4_SERVICE_ACCOUNT_JSON'):
             raise ValueError("Either GA4_SERVICE_ACCOUNT_PATH or GA4_SERVICE_ACCOUNT_JSON must be set in environment")
-            
-        self._setup_client()
     
-    def _setup_client(self):
+    @property
+    def client(self) -> BetaAnalyticsDataClient:
+        """GA4 client shared across handler instances, built by connect() or on first use otherwise"""
+        if self._client is None:
+            self._client = self._setup_client()
+        return self._client
+    
+    def connect(self) -> BetaAnalyticsDataClient:
+        """Build the GA4 client now so credential errors surface immediately rather than on the first fetch"""
+        return self.client
+    
+    def _setup_client(self) -> BetaAnalyticsDataClient:
         """Setup GA4 client with service account authentication"""
+        cache_key = 'env' if os.getenv('GA4_SERVICE_ACCOUNT_JSON') else self.credentials_path
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(cache_key)
+            if client is None:
+                client = _CLIENT_CACHE[cache_key] = self._create_client()
+        return client
+    
+    def _create_client(self) -> BetaAnalyticsDataClient:
+        """Create a GA4 client from service account credentials"""
         try:
             # Try to get credentials from environment variable first (for GitHub Actions)
             service_account_json = os.getenv('GA4_SERVICE_ACCOUNT_JSON')
@@ -60,8 +100,9 @@ class GA4DataHandler:
                 )
                 print(f"✅ Using GA4 credentials from file: {self.credentials_path}")
             
-            self.client = BetaAnalyticsDataClient(credentials=credentials)
-            print(f"✅ GA4 client initialized successfully for properties Web:{self.web_property_id}, App:{self.app_property_id}")
+            client = BetaAnalyticsDataClient(credentials=credentials)
+            print("✅ GA4 client initialized successfully")
+            return client
         except Exception as e:
             print(f"❌ Failed to initialize GA4 client: {e}")
             raise
@@ -90,12 +131,20 @@ class GA4DataHandler:
     
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
+        wait=wait_random_exponential(multiplier=1, min=1, max=8),
+        # Only transient failures are worth retrying; auth/permission/argument errors fail fast
+        retry=retry_if_exception_type((
+            gax.ServiceUnavailable,
+            gax.TooManyRequests,
+            gax.DeadlineExceeded,
+            gax.InternalServerError
+        ))
     )
     def _make_api_request(self, request: RunReportRequest):
         """Make GA4 API request with retry logic"""
         try:
-            response = self.client.run_report(request)
+            with self._concurrency:
+                response = self.client.run_report(request)
             return response
         except Exception as e:
             print(f"GA4 API request failed: {e}")
@@ -103,6 +152,20 @@ class GA4DataHandler:
     
     def query_ga4_sessions(self, date_range: Dict[str, str]) -> Dict[str, Any]:
         """Query both GA4 properties separately for accurate platform breakdown"""
+        return self.query_ga4_sessions_multi([date_range])[0]
+    
+    def query_ga4_sessions_multi(self, date_ranges: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Query both GA4 properties for several date ranges with one request per property"""
+        # GA4 accepts multiple date ranges per report and tags each row with "date_range_<i>";
+        # names are left unset since the API rejects custom names with that reserved prefix
+        ranges = [
+            DateRange(
+                start_date=date_range['start_date'],
+                end_date=date_range['end_date']
+            )
+            for date_range in date_ranges
+        ]
+        
         # Query web property
         web_request = RunReportRequest(
             property=f"properties/{self.web_property_id}",
@@ -110,10 +173,7 @@ class GA4DataHandler:
                 Metric(name="sessions"),
                 Metric(name="activeUsers")
             ],
-            date_ranges=[DateRange(
-                start_date=date_range['start_date'], 
-                end_date=date_range['end_date']
-            )],
+            date_ranges=ranges,
             return_property_quota=True
         )
         
@@ -124,37 +184,43 @@ class GA4DataHandler:
                 Metric(name="sessions"),
                 Metric(name="activeUsers")
             ],
-            date_ranges=[DateRange(
-                start_date=date_range['start_date'], 
-                end_date=date_range['end_date']
-            )],
+            date_ranges=ranges,
             return_property_quota=True
         )
         
         web_response = self._make_api_request(web_request)
         app_response = self._make_api_request(app_request)
         
-        return self._process_dual_property_response(web_response, app_response)
+        return self._process_dual_property_response(web_response, app_response, date_ranges)
+    
+    def _extract_sessions_by_range(self, response, range_count: int) -> List[int]:
+        """Extract session counts per requested date range from a GA4 response"""
+        sessions = [0] * range_count
+        for row in response.rows:
+            if row.dimension_values:
+                # Rows are tagged "date_range_<i>" when more than one range is requested
+                range_name = row.dimension_values[0].value
+                index = int(range_name.rsplit('_', 1)[-1])
+            else:
+                index = 0
+            sessions[index] = int(row.metric_values[0].value)
+        return sessions
     
-    def _process_dual_property_response(self, web_response, app_response) -> Dict[str, Any]:
+    def _process_dual_property_response(self, web_response, app_response, date_ranges: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """Process responses from both GA4 properties into standardized format"""
-        # Extract web sessions
-        web_sessions = 0
-        if web_response.rows:
-            web_sessions = int(web_response.rows[0].metric_values[0].value)
+        web_sessions = self._extract_sessions_by_range(web_response, len(date_ranges))
+        app_sessions = self._extract_sessions_by_range(app_response, len(date_ranges))
         
-        # Extract app sessions  
-        app_sessions = 0
-        if app_response.rows:
-            app_sessions = int(app_response.rows[0].metric_values[0].value)
+        results = []
+        for date_range, web, app in zip(date_ranges, web_sessions, app_sessions):
+            print(f"GA4 Sessions ({date_range['start_date']} to {date_range['end_date']}) - Web: {web:,}, App: {app:,}")
+            results.append({
+                'web': web,
+                'apps': app,
+                'combined': web + app
+            })
         
-        print(f"GA4 Sessions - Web: {web_sessions:,}, App: {app_sessions:,}")
-        
-        return {
-            'web': web_sessions,
-            'apps': app_sessions,
-            'combined': web_sessions + app_sessions
-        }
+        return results
     
     def get_weekly_yoy_data(self, target_week: int = None, target_year: int = None) -> Dict[str, Any]:
         """Get GA4 weekly year-over-year data in standardized format"""
@@ -166,13 +232,10 @@ class GA4DataHandler:
         
         print(f"🔍 Fetching GA4 data for Week {target_week} ({target_year})")
         
-        # Get current year data
+        # Get current and previous year data in a single request per property
         current_date_range = self.iso_week_to_ga4_dates(target_year, target_week)
-        current_data = self.query_ga4_sessions(current_date_range)
-        
-        # Get previous year data
         previous_date_range = self.iso_week_to_ga4_dates(target_year - 1, target_week)
-        previous_data = self.query_ga4_sessions(previous_date_range)
+        current_data, previous_data = self.query_ga4_sessions_multi([current_date_range, previous_date_range])
         
         # Calculate YoY changes
         sessions_metrics = {}
@@ -194,6 +257,18 @@ class GA4DataHandler:
         
         return self.standardize_output(sessions_metrics, target_week, target_year)
     
+    async def get_weekly_yoy_data_async(self, target_week: int, target_year: int) -> Dict[str, Any]:
+        """Async wrapper around get_weekly_yoy_data that runs the blocking calls in a worker thread"""
+        return await asyncio.to_thread(self.get_weekly_yoy_data, target_week, target_year)
+    
+    async def fetch_many_weeks(self, weeks: List[Tuple[int, int]]) -> List[Any]:
+        """Fetch weekly YoY data for several (target_week, target_year) pairs concurrently, e.g. for a backfill"""
+        # In-flight API calls stay capped by the class-level request semaphore. Results keep input
+        # order, and a failed week is returned as its exception so the rest of the backfill survives
+        return await asyncio.gather(*(
+            self.get_weekly_yoy_data_async(target_week=week, target_year=year) for week, year in weeks
+        ), return_exceptions=True)
+    
     def standardize_output(self, sessions_data: Dict[str, Any], target_week: int, target_year: int) -> Dict[str, Any]:
         """Standardize GA4 output to match expected format"""
         monday, sunday = self.get_week_date_range(target_year, target_week)
@@ -5,127 +5,207 @@ Creates a realistic comparison report to test the output format.
 """
 
 import os
-import requests
+import copy
 import json
-from datetime import datetime, timedelta
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dotenv import load_dotenv
 
+# orjson is optional - fall back to the stdlib encoder when it isn't installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 load_dotenv()
 
-class MockComparativeReport:
-    def __init__(self):
-        self.slack_webhook_url = os.getenv('SLACK_WEBHOOK_URL')
-        
-    def generate_mock_data(self):
-        """Generate realistic mock data for GA4 vs Amplitude comparison"""
-        return {
-            'week_info': {
-                'iso_week': 30,
-                'year': 2025,
-                'date_range': '2025-07-21 to 2025-07-27'
-            },
-            'amplitude_metrics': {
-                'sessions': {
-                    'apps': {
-                        'current': 54054,
-                        'previous': 40656,
-                        'yoy_change': 33.0
-                    },
-                    'web': {
-                        'current': 149215,
-                        'previous': 174835,
-                        'yoy_change': -14.7
-                    },
-                    'combined': {
-                        'current': 203269,
-                        'previous': 215491,
-                        'yoy_change': -5.7
-                    }
+# Emoji, arrow, direction word and magnitude for a YoY change, computed once per metric
+Delta = namedtuple('Delta', ['emoji', 'arrow', 'word', 'value'])
+
+# Canonical mrkdwn templates for overview metrics and per-platform fields, keyed by value type
+_COUNT_METRIC_TPL = "{d.emoji} *{label}* {d.word} {d.value:.1f}% YoY\n`{current:,} vs {previous:,}`"
+_RATE_METRIC_TPL = "{d.emoji} *{label}* {d.word} {d.value:.1f} ppts YoY\n`{current:.1f}% vs {previous:.1f}%`"
+_RATIO_METRIC_TPL = "{d.emoji} *{label}* {d.word} {d.value:.1f}% YoY\n`{current:.2f} vs {previous:.2f}`"
+_COUNT_PLATFORM_TPL = "{d.emoji} *{label}*\n{d.arrow} {d.value:.1f}% {d.word} YoY\n`{current:,} vs {previous:,}`"
+_RATE_PLATFORM_TPL = "{d.emoji} *{label}*\n{d.arrow} {d.value:.1f} ppts {d.word} YoY\n`{current:.1f}% vs {previous:.1f}%`"
+
+def _delta(yoy_change, up_emoji="🔥", down_emoji="⚠️"):
+    """Precompute the display pieces for a volume metric's YoY change"""
+    is_up = yoy_change > 0
+    return Delta(
+        up_emoji if is_up else down_emoji,
+        "🟢" if is_up else "🔴",
+        "up" if is_up else "down",
+        abs(yoy_change)
+    )
+
+def _conv_delta(yoy_change):
+    """Precompute the display pieces for a conversion metric's YoY change"""
+    return _delta(yoy_change, "🚀", "📉")
+
+# Static Data Sources section shared by every mock report
+_DATA_SOURCES_BLOCKS = (
+    {
+        "type": "divider"
+    },
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "*📋 Data Sources*"
+        }
+    },
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "*Dashboard:* <https://app.amplitude.com/analytics/thortful/dashboard/6pqbsp18|Thortful Analytics Dashboard>\n\n*Charts Used:*\n• <https://app.amplitude.com/analytics/thortful/chart/y0ivh3am|Sessions (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/5vbaz782|Sessions (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/pc9c0crz|Sessions per User (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/3d400y6n|Sessions per User (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/42c5gcv4|Session Conversion % (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/3t0wgn4i|Session Conversion % (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/4j2gp4ph|User Conversion %>\n• GA4 Property (Mock Data)"
+        }
+    },
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": "🧪 *MOCK REPORT* - Testing format with GA4 comparison section | 🤖 *Generated by Enhanced Analytics Bot*"
+            }
+        ]
+    }
+)
+
+def _write_json(path, data):
+    """Write data to a JSON file, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+@lru_cache(maxsize=None)
+def _build_mock_data():
+    """Build the static mock data once; callers get a deep copy via generate_mock_data"""
+    return {
+        'week_info': {
+            'iso_week': 30,
+            'year': 2025,
+            'date_range': '2025-07-21 to 2025-07-27'
+        },
+        'amplitude_metrics': {
+            'sessions': {
+                'apps': {
+                    'current': 54054,
+                    'previous': 40656,
+                    'yoy_change': 33.0
                 },
-                'session_conversion': {
-                    'apps': {
-                        'current': 0.1945,
-                        'previous': 0.2392,
-                        'yoy_change': -4.5
-                    },
-                    'web': {
-                        'current': 0.1866,
-                        'previous': 0.1892,
-                        'yoy_change': -0.3
-                    },
-                    'combined': {
-                        'current': 0.1887,
-                        'previous': 0.1986,
-                        'yoy_change': -1.0
-                    }
+                'web': {
+                    'current': 149215,
+                    'previous': 174835,
+                    'yoy_change': -14.7
                 },
-                'metadata': {
-                    'source': 'amplitude'
+                'combined': {
+                    'current': 203269,
+                    'previous': 215491,
+                    'yoy_change': -5.7
                 }
             },
-            'ga4_metrics': {
-                'sessions': {
-                    'apps': {
-                        'current': 50620,
-                        'previous': 40150,
-                        'yoy_change': 26.1
-                    },
-                    'web': {
-                        'current': 134800,
-                        'previous': 158200,
-                        'yoy_change': -14.8
-                    },
-                    'combined': {
-                        'current': 185420,
-                        'previous': 198350,
-                        'yoy_change': -6.5
-                    }
+            'session_conversion': {
+                'apps': {
+                    'current': 0.1945,
+                    'previous': 0.2392,
+                    'yoy_change': -4.5
                 },
-                'conversions': {
-                    'purchase_events': {
-                        'current': 2500,
-                        'previous': 2300,
-                        'yoy_change': 8.7
-                    },
-                    'revenue': {
-                        'current': 85000,
-                        'previous': 78000,
-                        'yoy_change': 9.0
-                    },
-                    'conversion_rate': {
-                        'current': 0.0135,
-                        'previous': 0.0116,
-                        'yoy_change': 1.9  # percentage points * 100
-                    }
+                'web': {
+                    'current': 0.1866,
+                    'previous': 0.1892,
+                    'yoy_change': -0.3
                 },
-                'metadata': {
-                    'source': 'ga4'
+                'combined': {
+                    'current': 0.1887,
+                    'previous': 0.1986,
+                    'yoy_change': -1.0
                 }
             },
-            'variance_analysis': {
-                'total_sessions': {
-                    'amplitude': 203269,
-                    'ga4': 185420,
-                    'variance_pct': -8.8,
-                    'variance_direction': 'ga4_lower'
+            'metadata': {
+                'source': 'amplitude'
+            }
+        },
+        'ga4_metrics': {
+            'sessions': {
+                'apps': {
+                    'current': 50620,
+                    'previous': 40150,
+                    'yoy_change': 26.1
                 },
-                'web_sessions': {
-                    'amplitude': 149215,
-                    'ga4': 134800,
-                    'variance_pct': -9.7
+                'web': {
+                    'current': 134800,
+                    'previous': 158200,
+                    'yoy_change': -14.8
+                },
+                'combined': {
+                    'current': 185420,
+                    'previous': 198350,
+                    'yoy_change': -6.5
+                }
+            },
+            'conversions': {
+                'purchase_events': {
+                    'current': 2500,
+                    'previous': 2300,
+                    'yoy_change': 8.7
                 },
-                'app_sessions': {
-                    'amplitude': 54054,
-                    'ga4': 50620,
-                    'variance_pct': -6.4
+                'revenue': {
+                    'current': 85000,
+                    'previous': 78000,
+                    'yoy_change': 9.0
                 },
-                'insights': {
-                    'consistent_variance': True,
-                    'typical_range': '6-10% lower for GA4',
-                    'growth_trend_alignment': 'similar_yoy_patterns'
+                'conversion_rate': {
+                    'current': 0.0135,
+                    'previous': 0.0116,
+                    'yoy_change': 1.9  # percentage points * 100
                 }
+            },
+            'metadata': {
+                'source': 'ga4'
+            }
+        },
+        'variance_analysis': {
+            'total_sessions': {
+                'amplitude': 203269,
+                'ga4': 185420,
+                'variance_pct': -8.8,
+                'variance_direction': 'ga4_lower'
+            },
+            'web_sessions': {
+                'amplitude': 149215,
+                'ga4': 134800,
+                'variance_pct': -9.7
+            },
+            'app_sessions': {
+                'amplitude': 54054,
+                'ga4': 50620,
+                'variance_pct': -6.4
+            },
+            'insights': {
+                'consistent_variance': True,
+                'typical_range': '6-10% lower for GA4',
+                'growth_trend_alignment': 'similar_yoy_patterns'
             }
         }
+    }
+
+class MockComparativeReport:
+    def __init__(self):
+        self.slack_webhook_url = os.getenv('SLACK_WEBHOOK_URL')
+        # Keep-alive session for webhook posts, created on first send
+        self.session = None
+        
+    def generate_mock_data(self):
+        """Generate realistic mock data for GA4 vs Amplitude comparison"""
+        # Copy the cached template so a caller mutating its report cannot alter later ones
+        return copy.deepcopy(_build_mock_data())
     
     def format_amplitude_style_report(self, mock_data):
         """Format the report using original Amplitude format with added GA4 comparison section"""
@@ -134,121 +214,71 @@ class MockComparativeReport:
         ga4 = mock_data['ga4_metrics']
         variance = mock_data['variance_analysis']
         
-        # Start with original Amplitude format
-        blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"📊 Week {week_info['iso_week']} Analytics Report (MOCK)",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"📅 *{week_info['date_range']}*"
-                    }
-                ]
-            },
-            {
-                "type": "divider"
-            }
-        ]
-        
         # Original Amplitude Key Metrics Overview section
         metric_fields = []
         
         # Sessions (Amplitude data)
         sessions_data = amplitude['sessions']['combined']
-        sessions_emoji = "🔥" if sessions_data['yoy_change'] > 0 else "⚠️"
+        d = _delta(sessions_data['yoy_change'])
         metric_fields.append({
             "type": "mrkdwn",
-            "text": f"{sessions_emoji} *Sessions* {'up' if sessions_data['yoy_change'] > 0 else 'down'} {abs(sessions_data['yoy_change']):.1f}% YoY\n`{int(sessions_data['current']):,} vs {int(sessions_data['previous']):,}`"
+            "text": _COUNT_METRIC_TPL.format(d=d, label="Sessions", current=int(sessions_data['current']), previous=int(sessions_data['previous']))
         })
         
         # Session Conversion (Amplitude data)
         conv_data = amplitude['session_conversion']['combined']
-        conv_emoji = "🚀" if conv_data['yoy_change'] > 0 else "📉"
+        d = _conv_delta(conv_data['yoy_change'])
         metric_fields.append({
             "type": "mrkdwn", 
-            "text": f"{conv_emoji} *Session CVR* {'up' if conv_data['yoy_change'] > 0 else 'down'} {abs(conv_data['yoy_change']):.1f} ppts YoY\n`{conv_data['current']*100:.1f}% vs {conv_data['previous']*100:.1f}%`"
+            "text": _RATE_METRIC_TPL.format(d=d, label="Session CVR", current=conv_data['current']*100, previous=conv_data['previous']*100)
         })
         
         # Sessions per User (mock data - would come from Amplitude)
         spu_data = {'current': 1.55, 'previous': 1.46, 'yoy_change': 5.7}
-        spu_emoji = "🔥" if spu_data['yoy_change'] > 0 else "⚠️"
+        d = _delta(spu_data['yoy_change'])
         metric_fields.append({
             "type": "mrkdwn",
-            "text": f"{spu_emoji} *Sessions per User* {'up' if spu_data['yoy_change'] > 0 else 'down'} {abs(spu_data['yoy_change']):.1f}% YoY\n`{spu_data['current']:.2f} vs {spu_data['previous']:.2f}`"
+            "text": _RATIO_METRIC_TPL.format(d=d, label="Sessions per User", current=spu_data['current'], previous=spu_data['previous'])
         })
         
         # User Conversion (mock data - would come from Amplitude)
         uc_data = {'current': 0.287, 'previous': 0.287, 'yoy_change': 0.0}
-        uc_emoji = "🚀" if uc_data['yoy_change'] > 0 else "📉"
+        d = _conv_delta(uc_data['yoy_change'])
         metric_fields.append({
             "type": "mrkdwn",
-            "text": f"{uc_emoji} *User CVR* {'up' if uc_data['yoy_change'] > 0 else 'down'} {abs(uc_data['yoy_change']):.1f} ppts YoY\n`{uc_data['current']*100:.1f}% vs {uc_data['previous']*100:.1f}%`"
+            "text": _RATE_METRIC_TPL.format(d=d, label="User CVR", current=uc_data['current']*100, previous=uc_data['previous']*100)
         })
         
-        # Add metrics section
-        blocks.extend([
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*📈 Key Metrics Overview*"
-                }
-            },
-            {
-                "type": "section", 
-                "fields": metric_fields
-            }
-        ])
-        
-        # Original Platform Analysis section
+        # Platform session volumes
         web_sessions = amplitude['sessions']['web']
         app_sessions = amplitude['sessions']['apps']
         combined_sessions = amplitude['sessions']['combined']
         web_volume_pct = (web_sessions['current'] / combined_sessions['current']) * 100
         
-        blocks.extend([
-            {
-                "type": "divider"
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*🎯 Platform Analysis*\n💻 Web {web_volume_pct:.0f}%, 📱 App {(100-web_volume_pct):.0f}% of sessions"
-                }
-            }
-        ])
-        
         # Platform details (original Amplitude format)
-        web_emoji = "🔥" if web_sessions.get('yoy_change', 0) > 0 else "⚠️"
-        app_emoji = "🔥" if app_sessions.get('yoy_change', 0) > 0 else "⚠️"
-        web_conv_emoji = "🚀" if amplitude['session_conversion']['web']['yoy_change'] > 0 else "📉"
-        app_conv_emoji = "🚀" if amplitude['session_conversion']['apps']['yoy_change'] > 0 else "📉"
+        web_conv = amplitude['session_conversion']['web']
+        app_conv = amplitude['session_conversion']['apps']
+        web_d = _delta(web_sessions.get('yoy_change', 0))
+        app_d = _delta(app_sessions.get('yoy_change', 0))
+        web_conv_d = _conv_delta(web_conv['yoy_change'])
+        app_conv_d = _conv_delta(app_conv['yoy_change'])
         
         platform_fields = [
             {
                 "type": "mrkdwn",
-                "text": f"{web_emoji} *Web Sessions*\n{'🟢' if web_sessions['yoy_change'] > 0 else '🔴'} {abs(web_sessions['yoy_change']):.1f}% {'up' if web_sessions['yoy_change'] > 0 else 'down'} YoY\n`{int(web_sessions['current']):,} vs {int(web_sessions['previous']):,}`"
+                "text": _COUNT_PLATFORM_TPL.format(d=web_d, label="Web Sessions", current=int(web_sessions['current']), previous=int(web_sessions['previous']))
             },
             {
                 "type": "mrkdwn", 
-                "text": f"{app_emoji} *App Sessions*\n{'🟢' if app_sessions['yoy_change'] > 0 else '🔴'} {abs(app_sessions['yoy_change']):.1f}% {'up' if app_sessions['yoy_change'] > 0 else 'down'} YoY\n`{int(app_sessions['current']):,} vs {int(app_sessions['previous']):,}`"
+                "text": _COUNT_PLATFORM_TPL.format(d=app_d, label="App Sessions", current=int(app_sessions['current']), previous=int(app_sessions['previous']))
             },
             {
                 "type": "mrkdwn",
-                "text": f"{web_conv_emoji} *Web Session CVR*\n{'🟢' if amplitude['session_conversion']['web']['yoy_change'] > 0 else '🔴'} {abs(amplitude['session_conversion']['web']['yoy_change']):.1f} ppts {'up' if amplitude['session_conversion']['web']['yoy_change'] > 0 else 'down'} YoY\n`{amplitude['session_conversion']['web']['current']*100:.1f}% vs {amplitude['session_conversion']['web']['previous']*100:.1f}%`"
+                "text": _RATE_PLATFORM_TPL.format(d=web_conv_d, label="Web Session CVR", current=web_conv['current']*100, previous=web_conv['previous']*100)
             },
             {
                 "type": "mrkdwn",
-                "text": f"{app_conv_emoji} *App Session CVR*\n{'🟢' if amplitude['session_conversion']['apps']['yoy_change'] > 0 else '🔴'} {abs(amplitude['session_conversion']['apps']['yoy_change']):.1f} ppts {'up' if amplitude['session_conversion']['apps']['yoy_change'] > 0 else 'down'} YoY\n`{amplitude['session_conversion']['apps']['current']*100:.1f}% vs {amplitude['session_conversion']['apps']['previous']*100:.1f}%`"
+                "text": _RATE_PLATFORM_TPL.format(d=app_conv_d, label="App Session CVR", current=app_conv['current']*100, previous=app_conv['previous']*100)
             },
             # Sessions per user (mock additional data)
             {
@@ -270,13 +300,59 @@ class MockComparativeReport:
             }
         ]
         
-        blocks.append({
-            "type": "section",
-            "fields": platform_fields
-        })
+        # Single-cell sheets summary text (mock data)
+        sheets_data = f"Week {week_info['iso_week']} ({week_info['date_range']}):\nSessions ↓{abs(amplitude['sessions']['combined']['yoy_change']):.1f}% YoY | Session CVR ↓{abs(amplitude['session_conversion']['combined']['yoy_change']):.1f}ppts YoY | Sessions/User ↑{spu_data['yoy_change']:.1f}% YoY\nWeb: Sessions ↓{abs(amplitude['sessions']['web']['yoy_change']):.1f}% | Session CVR ↓{abs(amplitude['session_conversion']['web']['yoy_change']):.1f}ppts\nApp: Sessions ↑{amplitude['sessions']['apps']['yoy_change']:.1f}% | Session CVR ↓{abs(amplitude['session_conversion']['apps']['yoy_change']):.1f}ppts"
         
-        # NEW: GA4 vs Amplitude Session Comparison section
-        blocks.extend([
+        # Original Amplitude format, platform analysis, GA4 comparison, sheets export and data sources
+        blocks = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": f"📊 Week {week_info['iso_week']} Analytics Report (MOCK)",
+                    "emoji": True
+                }
+            },
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"📅 *{week_info['date_range']}*"
+                    }
+                ]
+            },
+            {
+                "type": "divider"
+            },
+            # Original Amplitude Key Metrics Overview section
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "*📈 Key Metrics Overview*"
+                }
+            },
+            {
+                "type": "section", 
+                "fields": metric_fields
+            },
+            # Original Platform Analysis section
+            {
+                "type": "divider"
+            },
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*🎯 Platform Analysis*\n💻 Web {web_volume_pct:.0f}%, 📱 App {(100-web_volume_pct):.0f}% of sessions"
+                }
+            },
+            {
+                "type": "section",
+                "fields": platform_fields
+            },
+            # NEW: GA4 vs Amplitude Session Comparison section
             {
                 "type": "divider"
             },
@@ -307,13 +383,8 @@ class MockComparativeReport:
                         "text": f"*📈 YoY Trends*\nAmplitude: {amplitude['sessions']['combined']['yoy_change']:.1f}% change\nGA4: {ga4['sessions']['combined']['yoy_change']:.1f}% change\nTrend alignment: Similar patterns"
                     }
                 ]
-            }
-        ])
-        
-        # Original Google Sheets Export Section (mock data)
-        sheets_data = f"Week {week_info['iso_week']} ({week_info['date_range']}):\nSessions ↓{abs(amplitude['sessions']['combined']['yoy_change']):.1f}% YoY | Session CVR ↓{abs(amplitude['session_conversion']['combined']['yoy_change']):.1f}ppts YoY | Sessions/User ↑{spu_data['yoy_change']:.1f}% YoY\nWeb: Sessions ↓{abs(amplitude['sessions']['web']['yoy_change']):.1f}% | Session CVR ↓{abs(amplitude['session_conversion']['web']['yoy_change']):.1f}ppts\nApp: Sessions ↑{amplitude['sessions']['apps']['yoy_change']:.1f}% | Session CVR ↓{abs(amplitude['session_conversion']['apps']['yoy_change']):.1f}ppts"
-        
-        blocks.extend([
+            },
+            # Original Google Sheets Export Section (mock data)
             {
                 "type": "divider"
             },
@@ -330,38 +401,10 @@ class MockComparativeReport:
                     "type": "mrkdwn",
                     "text": f"```{sheets_data}```"
                 }
-            }
-        ])
-        
-        # Original Data Sources Section
-        blocks.extend([
-            {
-                "type": "divider"
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*📋 Data Sources*"
-                }
             },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Dashboard:* <https://app.amplitude.com/analytics/thortful/dashboard/6pqbsp18|Thortful Analytics Dashboard>\n\n*Charts Used:*\n• <https://app.amplitude.com/analytics/thortful/chart/y0ivh3am|Sessions (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/5vbaz782|Sessions (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/pc9c0crz|Sessions per User (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/3d400y6n|Sessions per User (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/42c5gcv4|Session Conversion % (Current Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/3t0wgn4i|Session Conversion % (Previous Year)>\n• <https://app.amplitude.com/analytics/thortful/chart/4j2gp4ph|User Conversion %>\n• GA4 Property (Mock Data)"
-                }
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "🧪 *MOCK REPORT* - Testing format with GA4 comparison section | 🤖 *Generated by Enhanced Analytics Bot*"
-                    }
-                ]
-            }
-        ])
+            # Original Data Sources Section
+            *_DATA_SOURCES_BLOCKS
+        ]
         
         return {
             "text": f"📊 Week {week_info['iso_week']} Analytics Report (MOCK)",
@@ -380,22 +423,33 @@ class MockComparativeReport:
         # Format for Slack
         slack_message = self.format_amplitude_style_report(mock_data)
         
-        # Send to Slack
-        try:
-            response = requests.post(self.slack_webhook_url, json=slack_message)
-            response.raise_for_status()
-            print("✅ Mock comparative report sent to Slack successfully!")
-            
-            # Also save the mock data for reference
-            with open('mock_comparative_analysis.json', 'w') as f:
-                json.dump(mock_data, f, indent=2)
-            print("📄 Mock data saved to mock_comparative_analysis.json")
+        # requests is only needed when actually posting, so import it here
+        import requests
+        if self.session is None:
+            self.session = requests.Session()
+        
+        # Send to Slack while saving the mock data for reference in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            write_future = executor.submit(_write_json, 'mock_comparative_analysis.json', mock_data)
+            post_future = executor.submit(self.session.post, self.slack_webhook_url, json=slack_message, timeout=10)
             
-            return True
+            try:
+                response = post_future.result()
+                response.raise_for_status()
+                print("✅ Mock comparative report sent to Slack successfully!")
+                sent = True
+            except requests.exceptions.RequestException as e:
+                print(f"❌ Failed to send mock report to Slack: {e}")
+                sent = False
             
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Failed to send mock report to Slack: {e}")
-            return False
+            # The file is written regardless of the Slack outcome, so report it separately
+            try:
+                write_future.result()
+                print("📄 Mock data saved to mock_comparative_analysis.json")
+            except OSError as e:
+                print(f"❌ Failed to save mock data: {e}")
+        
+        return sent
 
 def main():
     """Generate and send mock comparative report"""
@@ -6,8 +6,9 @@ Combines Amplitude and GA4 data handlers to produce comparative analytics report
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 from dotenv import load_dotenv
 
 from amplitude_data_handler import AmplitudeDataHandler
@@ -29,7 +30,10 @@ class UnifiedAnalyzer:
         self.ga4_handler = None
         if self.ga4_enabled:
             try:
-                self.ga4_handler = GA4DataHandler()
+                ga4_handler = GA4DataHandler()
+                # Build the client up front so bad credentials disable GA4 here
+                ga4_handler.connect()
+                self.ga4_handler = ga4_handler
                 print("✅ GA4 integration enabled and connected")
             except Exception as e:
                 print(f"⚠️ GA4 integration disabled due to error: {e}")
@@ -113,17 +117,24 @@ class UnifiedAnalyzer:
         
         print(f"🔍 Analyzing unified data for Week {target_week} ({target_year})")
         
-        # Get Amplitude data
-        amplitude_data = self.amplitude_handler.get_weekly_yoy_data(target_week, target_year)
-        
-        # Get GA4 data if enabled
-        ga4_data = None
-        if self.ga4_enabled and self.ga4_handler:
-            try:
-                ga4_data = self.ga4_handler.get_weekly_yoy_data(target_week, target_year)
-            except Exception as e:
-                print(f"⚠️ GA4 data fetch failed: {e}")
-                ga4_data = None
+        # Amplitude and GA4 fetches are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            amplitude_future = executor.submit(self.amplitude_handler.get_weekly_yoy_data, target_week, target_year)
+            
+            # Get GA4 data if enabled
+            ga4_future = None
+            if self.ga4_enabled and self.ga4_handler:
+                ga4_future = executor.submit(self.ga4_handler.get_weekly_yoy_data, target_week, target_year)
+            
+            amplitude_data = amplitude_future.result()
+            
+            ga4_data = None
+            if ga4_future:
+                try:
+                    ga4_data = ga4_future.result()
+                except Exception as e:
+                    print(f"⚠️ GA4 data fetch failed: {e}")
+                    ga4_data = None
         
         # Calculate variance analysis
         variance_analysis = None
@@ -150,32 +161,32 @@ class UnifiedAnalyzer:
         variance = unified_data.get('variance_analysis')
         
         # Start with standard Amplitude summary
-        summary = f"Week {week_info['iso_week']} Analysis ({week_info['date_range']}):\n\n"
+        parts = [f"Week {week_info['iso_week']} Analysis ({week_info['date_range']}):\n\n"]
         
         # Amplitude metrics (preserve original format)
         if amplitude.get('sessions'):
             sessions_data = amplitude['sessions']['combined']
             sessions_direction = "up" if sessions_data['yoy_change'] > 0 else "down"
-            summary += f"Sessions {sessions_direction} {abs(sessions_data['yoy_change']):.1f}% YoY ({int(sessions_data['current']):,} vs {int(sessions_data['previous']):,})"
+            parts.append(f"Sessions {sessions_direction} {abs(sessions_data['yoy_change']):.1f}% YoY ({int(sessions_data['current']):,} vs {int(sessions_data['previous']):,})")
         
         if amplitude.get('session_conversion'):
             conv_data = amplitude['session_conversion']['combined']
             conv_direction = "up" if conv_data['yoy_change'] > 0 else "down"
-            summary += f", session conversion {conv_direction} {abs(conv_data['yoy_change']):.1f} ppts YoY ({conv_data['current']*100:.1f}% vs {conv_data['previous']*100:.1f}%)"
+            parts.append(f", session conversion {conv_direction} {abs(conv_data['yoy_change']):.1f} ppts YoY ({conv_data['current']*100:.1f}% vs {conv_data['previous']*100:.1f}%)")
         
         if amplitude.get('sessions_per_user'):
             spu_data = amplitude['sessions_per_user']['combined']
             spu_direction = "up" if spu_data['yoy_change'] > 0 else "down"
-            summary += f", sessions per user {spu_direction} {abs(spu_data['yoy_change']):.1f}% YoY ({spu_data['current']:.2f} vs {spu_data['previous']:.2f})"
+            parts.append(f", sessions per user {spu_direction} {abs(spu_data['yoy_change']):.1f}% YoY ({spu_data['current']:.2f} vs {spu_data['previous']:.2f})")
         
         if amplitude.get('user_conversion') and isinstance(amplitude['user_conversion'], dict):
             if amplitude['user_conversion'].get('combined') and isinstance(amplitude['user_conversion']['combined'], dict):
                 uc_data = amplitude['user_conversion']['combined']
                 if uc_data.get('yoy_change') is not None:
                     uc_direction = "up" if uc_data['yoy_change'] > 0 else "down"
-                    summary += f", and user conversion {uc_direction} {abs(uc_data['yoy_change']):.1f} ppts YoY ({uc_data['current']*100:.1f}% vs {uc_data['previous']*100:.1f}%)"
+                    parts.append(f", and user conversion {uc_direction} {abs(uc_data['yoy_change']):.1f} ppts YoY ({uc_data['current']*100:.1f}% vs {uc_data['previous']*100:.1f}%)")
         
-        summary += ". \n\n"
+        parts.append(". \n\n")
         
         # Platform Analysis (Amplitude data)
         if amplitude.get('sessions'):
@@ -186,28 +197,28 @@ class UnifiedAnalyzer:
             web_volume_pct = (web_sessions['current'] / combined_sessions['current']) * 100
             app_volume_pct = (app_sessions['current'] / combined_sessions['current']) * 100
             
-            summary += f"Platform Analysis:\nWeb {web_volume_pct:.0f}%, App {app_volume_pct:.0f}% of sessions\n\n"
+            parts.append(f"Platform Analysis:\nWeb {web_volume_pct:.0f}%, App {app_volume_pct:.0f}% of sessions\n\n")
             
-            summary += f"Web: sessions {('up' if web_sessions['yoy_change'] > 0 else 'down')} {abs(web_sessions['yoy_change']):.1f}% YoY ({int(web_sessions['current']):,} vs {int(web_sessions['previous']):,})"
+            parts.append(f"Web: sessions {('up' if web_sessions['yoy_change'] > 0 else 'down')} {abs(web_sessions['yoy_change']):.1f}% YoY ({int(web_sessions['current']):,} vs {int(web_sessions['previous']):,})")
             
             if amplitude.get('session_conversion'):
                 web_conv = amplitude['session_conversion']['web']
-                summary += f", conversion {('up' if web_conv['yoy_change'] > 0 else 'down')} {abs(web_conv['yoy_change']):.1f} ppts YoY ({web_conv['current']*100:.1f}% vs {web_conv['previous']*100:.1f}%)"
-            summary += "\n"
+                parts.append(f", conversion {('up' if web_conv['yoy_change'] > 0 else 'down')} {abs(web_conv['yoy_change']):.1f} ppts YoY ({web_conv['current']*100:.1f}% vs {web_conv['previous']*100:.1f}%)")
+            parts.append("\n")
             
-            summary += f"Apps: sessions {('up' if app_sessions['yoy_change'] > 0 else 'down')} {abs(app_sessions['yoy_change']):.1f}% YoY ({int(app_sessions['current']):,} vs {int(app_sessions['previous']):,})"
+            parts.append(f"Apps: sessions {('up' if app_sessions['yoy_change'] > 0 else 'down')} {abs(app_sessions['yoy_change']):.1f}% YoY ({int(app_sessions['current']):,} vs {int(app_sessions['previous']):,})")
             
             if amplitude.get('session_conversion'):
                 app_conv = amplitude['session_conversion']['apps']
-                summary += f", conversion {('up' if app_conv['yoy_change'] > 0 else 'down')} {abs(app_conv['yoy_change']):.1f} ppts YoY ({app_conv['current']*100:.1f}% vs {app_conv['previous']*100:.1f}%)"
-            summary += "\n"
+                parts.append(f", conversion {('up' if app_conv['yoy_change'] > 0 else 'down')} {abs(app_conv['yoy_change']):.1f} ppts YoY ({app_conv['current']*100:.1f}% vs {app_conv['previous']*100:.1f}%)")
+            parts.append("\n")
         
         # Sessions per user details
         if amplitude.get('sessions_per_user'):
             web_spu = amplitude['sessions_per_user']['web']
             app_spu = amplitude['sessions_per_user']['apps']
             
-            summary += f"\nSessions per user: Web {('up' if web_spu['yoy_change'] > 0 else 'down')} {abs(web_spu['yoy_change']):.1f}% YoY ({web_spu['current']:.2f} vs {web_spu['previous']:.2f}), App {('up' if app_spu['yoy_change'] > 0 else 'down')} {abs(app_spu['yoy_change']):.1f}% YoY ({app_spu['current']:.2f} vs {app_spu['previous']:.2f})"
+            parts.append(f"\nSessions per user: Web {('up' if web_spu['yoy_change'] > 0 else 'down')} {abs(web_spu['yoy_change']):.1f}% YoY ({web_spu['current']:.2f} vs {web_spu['previous']:.2f}), App {('up' if app_spu['yoy_change'] > 0 else 'down')} {abs(app_spu['yoy_change']):.1f}% YoY ({app_spu['current']:.2f} vs {app_spu['previous']:.2f})")
         
         # User conversion details
         if amplitude.get('user_conversion') and isinstance(amplitude['user_conversion'], dict):
@@ -215,16 +226,16 @@ class UnifiedAnalyzer:
                 web_uc = amplitude['user_conversion']['web']
                 app_uc = amplitude['user_conversion']['apps']
                 
-                summary += f"\nUser conversion: Web {('up' if web_uc['yoy_change'] > 0 else 'down')} {abs(web_uc['yoy_change']):.1f} ppts YoY ({web_uc['current']*100:.1f}% vs {web_uc['previous']*100:.1f}%), App {('up' if app_uc['yoy_change'] > 0 else 'down')} {abs(app_uc['yoy_change']):.1f} ppts YoY ({app_uc['current']*100:.1f}% vs {app_uc['previous']*100:.1f}%)"
+                parts.append(f"\nUser conversion: Web {('up' if web_uc['yoy_change'] > 0 else 'down')} {abs(web_uc['yoy_change']):.1f} ppts YoY ({web_uc['current']*100:.1f}% vs {web_uc['previous']*100:.1f}%), App {('up' if app_uc['yoy_change'] > 0 else 'down')} {abs(app_uc['yoy_change']):.1f} ppts YoY ({app_uc['current']*100:.1f}% vs {app_uc['previous']*100:.1f}%)")
         
         # Add GA4 comparison if available
         if ga4 and variance:
-            summary += f"\n\nGA4 vs Amplitude Session Comparison:\n"
-            summary += f"Total Sessions: Amplitude {int(amplitude['sessions']['combined']['current']):,}, GA4 {int(ga4['sessions']['combined']['current']):,} ({'+' if variance['combined_sessions']['variance_pct'] > 0 else ''}{variance['combined_sessions']['variance_pct']:.1f}% variance)\n"
-            summary += f"Web Sessions: Amplitude {int(amplitude['sessions']['web']['current']):,}, GA4 {int(ga4['sessions']['web']['current']):,} ({'+' if variance['web_sessions']['variance_pct'] > 0 else ''}{variance['web_sessions']['variance_pct']:.1f}% variance)\n"
-            summary += f"App Sessions: Amplitude {int(amplitude['sessions']['apps']['current']):,}, GA4 {int(ga4['sessions']['apps']['current']):,} ({'+' if variance['app_sessions']['variance_pct'] > 0 else ''}{variance['app_sessions']['variance_pct']:.1f}% variance)"
+            parts.append(f"\n\nGA4 vs Amplitude Session Comparison:\n")
+            parts.append(f"Total Sessions: Amplitude {int(amplitude['sessions']['combined']['current']):,}, GA4 {int(ga4['sessions']['combined']['current']):,} ({'+' if variance['combined_sessions']['variance_pct'] > 0 else ''}{variance['combined_sessions']['variance_pct']:.1f}% variance)\n")
+            parts.append(f"Web Sessions: Amplitude {int(amplitude['sessions']['web']['current']):,}, GA4 {int(ga4['sessions']['web']['current']):,} ({'+' if variance['web_sessions']['variance_pct'] > 0 else ''}{variance['web_sessions']['variance_pct']:.1f}% variance)\n")
+            parts.append(f"App Sessions: Amplitude {int(amplitude['sessions']['apps']['current']):,}, GA4 {int(ga4['sessions']['apps']['current']):,} ({'+' if variance['app_sessions']['variance_pct'] > 0 else ''}{variance['app_sessions']['variance_pct']:.1f}% variance)")
         
-        return summary
+        return "".join(parts)
 
 
 def main():